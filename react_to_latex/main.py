@@ -1,63 +1,42 @@
-import json
+import os
 import re
+import shutil
 import subprocess
-import os
+import sys
 from pathlib import Path
 
-
-def extract_experiences(js_code):
-    """
-    Extracts the experiences array from the React file string.
-    """
-    # Find the experiences = [ ... ]; block (non-greedy match for nested []s)
-    match = re.search(r"experiences\s*=\s*(\[[\s\S]*?\]);", js_code)
-    if not match:
-        raise ValueError("Could not find experiences array in file.")
-    array_str = match.group(1)
-    return array_str
-
-
-def js_to_py(js_str):
-    """
-    Converts minimal JS object/array syntax to Python-compatible syntax for ast.literal_eval.
-    (Assumes only keys/values as shown in your data; not full JS parser.)
-    """
-    # Replace JS null/true/false
-    js_str = re.sub(r"\bnull\b", "None", js_str)
-    js_str = re.sub(r"\btrue\b", "True", js_str, flags=re.IGNORECASE)
-    js_str = re.sub(r"\bfalse\b", "False", js_str, flags=re.IGNORECASE)
-    # Ensure all keys are quoted
-    js_str = re.sub(r"(\w+)\s*:", r'"\1":', js_str)
-    # Replace single quotes with double quotes
-    js_str = js_str.replace("'", '"')
-
-    # Escape double quotes inside string values (not at start/end)
-    def escape_inner_quotes(match):
-        s = match.group(1)
-        # Only escape unescaped double quotes inside the string
-        s_escaped = re.sub(r"(?<!\\)\"", r'\\"', s)  # already escaped
-        s_escaped = re.sub(r'(?<!\\)"', r'\\"', s_escaped)
-        return '"' + s_escaped + '"'
-
-    js_str = re.sub(r'"((?:[^"\\]|\\.)*)"', escape_inner_quotes, js_str)
-    # Remove trailing commas (object/array)
-    js_str = re.sub(r",([\s\n]*[}}\]])", r"\1", js_str)
-    return js_str
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    import json as _json
+
+
+# Single-pass translation table: escaping every special character at once avoids
+# re-escaping the backslashes inserted by earlier replacements.
+_LATEX_TABLE = str.maketrans(
+    {
+        "&": "\\&",
+        "%": "\\%",
+        "#": "\\#",
+        "_": "\\_",
+        "$": "\\$",
+        "{": "\\{",
+        "}": "\\}",
+        "~": "\\textasciitilde{}",
+        "^": "\\^{}",
+        "\\": "\\textbackslash{}",
+    }
+)
+
+# Most CV text has no specials at all: one regex scan lets us return it untouched
+_LATEX_SPECIALS_RE = re.compile(r"[&%#_${}~^\\]")
 
 
 def escape_latex(text):
     # Simple LaTeX escaping
-    text = text.replace("&", "\\&")
-    text = text.replace("%", "\\%")
-    text = text.replace("#", "\\#")
-    text = text.replace("_", "\\_")
-    text = text.replace("$", "\\$")
-    text = text.replace("{", "\\{")
-    text = text.replace("}", "\\}")
-    text = text.replace("~", "\\textasciitilde{}")
-    text = text.replace("^", "\\^{}")
-    text = text.replace("\\", "\\textbackslash{}")
-    return text
+    if not _LATEX_SPECIALS_RE.search(text):
+        return text
+    return text.translate(_LATEX_TABLE)
 
 
 def render_achievements(achievements, indent="      "):
@@ -79,50 +58,59 @@ def render_position(company, loc, title, period, achievements, indent="    "):
 
 
 def render_experience(exp):
-    output = ""
-    company = exp["company"]
-    loc = exp["location"]
+    # Escape the shared header fields once; collect pieces and join at the end
+    company = escape_latex(exp["company"])
+    loc = escape_latex(exp["location"])
+    parts = ["    \\resumeSubheading\n"]
     if "positions" in exp:
         # Multi-position case (e.g., Sony)
-        output += "    \\resumeSubheading\n"
-        output += f"      {{{escape_latex(company)}}}{{{escape_latex(loc)}}}{{}}{{}}\n"
-        for i, pos in enumerate(exp["positions"]):
-            output += render_position(
-                company, loc, pos["title"], pos["period"], pos["achievements"]
+        parts.append(f"      {{{company}}}{{{loc}}}{{}}{{}}\n")
+        for pos in exp["positions"]:
+            parts.append(
+                render_position(company, loc, pos["title"], pos["period"], pos["achievements"])
             )
     else:
-        title = exp["position"]
-        period = exp["period"]
-        achievements = exp["achievements"]
-        output += "    \\resumeSubheading\n"
-        output += f"      {{{escape_latex(company)}}}{{{escape_latex(loc)}}}{{{escape_latex(title)}}}{{{escape_latex(period)}}}\n"
-        output += "      \\resumeItemListStart\n"
-        output += render_achievements(achievements, "        ")
-        output += "\n      \\resumeItemListEnd\n"
-    return output
+        title = escape_latex(exp["position"])
+        period = escape_latex(exp["period"])
+        parts.append(f"      {{{company}}}{{{loc}}}{{{title}}}{{{period}}}\n")
+        parts.append("      \\resumeItemListStart\n")
+        parts.append(render_achievements(exp["achievements"], "        "))
+        parts.append("\n      \\resumeItemListEnd\n")
+    return "".join(parts)
 
 
 def write_latex_experience(experiences, output_filename):
-    with open(output_filename, "w", encoding="utf-8") as f:
-        f.write("%-----------EXPERIENCE-----------------\n")
-        f.write("\\section{Experience}\n")
-        f.write("  \\resumeSubHeadingListStart\n")
-        for exp in experiences:
-            f.write(render_experience(exp))
-        f.write("  \\resumeSubHeadingListEnd\n")
+    chunks = [
+        "%-----------EXPERIENCE-----------------\n",
+        "\\section{Experience}\n",
+        "  \\resumeSubHeadingListStart\n",
+        *map(render_experience, experiences),
+        "  \\resumeSubHeadingListEnd\n",
+    ]
+    # Assemble the whole section in memory, then write it in one call
+    Path(output_filename).write_text("".join(chunks), encoding="utf-8")
 
 
 def main():
     # --- Part 1: Use Node.js (acorn) to extract experiences array as JSON ---
     react_filename = Path(os.environ["WEBSITE_REPO_PATH"]) / "src/components/Experience.tsx"
     node_script = Path(__file__).parent / "extract_experiences_acorn.js"
-    result = subprocess.run(
-        ["node", str(node_script), str(react_filename)], capture_output=True, text=True
-    )
+    if shutil.which("node") is None:
+        print(
+            "Error: Node.js ('node') is required to extract experiences with acorn.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    # Keep stdout as bytes: both orjson and json parse UTF-8 bytes directly
+    result = subprocess.run(["node", str(node_script), str(react_filename)], capture_output=True)
     if result.returncode != 0:
-        print("Error extracting experiences:", result.stderr)
-        exit(1)
-    experiences = json.loads(result.stdout)
+        print(
+            "Error extracting experiences:",
+            result.stderr.decode("utf-8", "replace"),
+            file=sys.stderr,
+        )
+        sys.exit(1)
+    experiences = _json.loads(result.stdout)
 
     # --- Output to file ---
     output_filename = "experience.tex"
@@ -1,9 +1,41 @@
 """CV Builder - Generate tailored CVs and website data from CSV sources."""
 
-from .filters import exclude_by_tags, filter_by_tags, get_all_tags
-from .generators import LaTeXGenerator, WebsiteGenerator
-from .loader import CVDataLoader
-from .models import CVData, Contact, Education, GroupedExperience, GroupedSkill, Patent, Publication
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .filters import exclude_by_tags, filter_by_tags, get_all_tags
+    from .generators import LaTeXGenerator, WebsiteGenerator
+    from .loader import CVDataLoader
+    from .models import (
+        Contact,
+        CVData,
+        Education,
+        GroupedExperience,
+        GroupedSkill,
+        Patent,
+        Publication,
+    )
+
+# Public name -> submodule. Resolved on first access so that importing a light
+# module (e.g. resume_builder.utils or the CLI) does not pull in pandas/pydantic.
+_EXPORTS = {
+    "CVData": ".models",
+    "CVDataLoader": ".loader",
+    "Contact": ".models",
+    "Education": ".models",
+    "GroupedExperience": ".models",
+    "GroupedSkill": ".models",
+    "LaTeXGenerator": ".generators",
+    "Patent": ".models",
+    "Publication": ".models",
+    "WebsiteGenerator": ".generators",
+    "exclude_by_tags": ".filters",
+    "filter_by_tags": ".filters",
+    "get_all_tags": ".filters",
+}
 
 __all__ = [
     "CVData",
@@ -20,3 +52,16 @@ __all__ = [
     "filter_by_tags",
     "get_all_tags",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # cache: later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,14 +5,17 @@ from __future__ import annotations
 import shutil
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from rich.console import Console
 from rich.table import Table
 
-from .filters import collect_all_tags_from_loader
-from .generators import LaTeXGenerator, WebsiteGenerator
-from .loader import CVDataLoader
+if TYPE_CHECKING:
+    from .loader import CVDataLoader
+
+# The data stack (pandas, pydantic, jinja2) is imported inside the commands that use
+# it, so `--help` and `build-pdf` start without loading it.
 
 console = Console()
 
@@ -27,9 +30,27 @@ DEFAULT_WEBSITE_DATA_DIR = (
 
 @click.group()
 @click.version_option()
-def cli() -> None:
+@click.pass_context
+def cli(ctx: click.Context) -> None:
     """CV Generator - Build tailored CVs and website data from CSV sources."""
-    pass
+    # Shared per-invocation state (e.g. CVDataLoader instances) for all subcommands
+    ctx.ensure_object(dict)
+
+
+def _get_loader(ctx: click.Context, data_path: Path) -> CVDataLoader:
+    """
+    Return the CVDataLoader for ``data_path`` shared across this CLI invocation.
+
+    Loaders live on ``ctx.obj`` (set up by the ``cli`` group), so commands chained
+    by ``all`` reuse the same loader and its cached CSV data.
+    """
+    from .loader import CVDataLoader
+
+    loaders = ctx.ensure_object(dict).setdefault("loaders", {})
+    key = data_path.resolve()
+    if key not in loaders:
+        loaders[key] = CVDataLoader(data_path)
+    return loaders[key]
 
 
 # Default exclude tags
@@ -75,7 +96,9 @@ DEFAULT_WEBSITE_EXCLUDE_TAGS = ["private", "sensitive", "extra"]
     default="default",
     help="Summary variant to use",
 )
+@click.pass_context
 def latex(
+    ctx: click.Context,
     tags: tuple[str, ...],
     exclude_tags: tuple[str, ...],
     output: str | None,
@@ -84,6 +107,8 @@ def latex(
     summary: str,
 ) -> None:
     """Generate LaTeX CV with optional tag filtering."""
+    from .generators import LaTeXGenerator
+
     # Parse tags (support both repeated -t and comma-separated)
     all_tags = []
     for tag_str in tags:
@@ -113,7 +138,7 @@ def latex(
     console.print(f"  Data: {data_path}")
     console.print(f"  Output: {output_path}")
 
-    generator = LaTeXGenerator(data_path, template_path)
+    generator = LaTeXGenerator(data_path, template_path, loader=_get_loader(ctx, data_path))
     result_path = generator.generate_to_file(
         output_path, all_tags or None, summary, all_exclude_tags or None
     )
@@ -147,13 +172,24 @@ def latex(
     default=None,
     help="Path to cv_data/ directory",
 )
+@click.option(
+    "--bundle",
+    is_flag=True,
+    default=False,
+    help="Also write every section into a single site_data.json",
+)
+@click.pass_context
 def website(
+    ctx: click.Context,
     tags: tuple[str, ...],
     exclude_tags: tuple[str, ...],
     output_dir: str | None,
     data_dir: str | None,
+    bundle: bool,
 ) -> None:
     """Generate JSON data files for React website."""
+    from .generators import WebsiteGenerator
+
     # Parse tags
     all_tags = []
     for tag_str in tags:
@@ -177,8 +213,8 @@ def website(
     console.print(f"  Data: {data_path}")
     console.print(f"  Output: {out_path}")
 
-    generator = WebsiteGenerator(data_path, out_path)
-    generated = generator.generate_all(all_tags or None, all_exclude_tags or None)
+    generator = WebsiteGenerator(data_path, out_path, loader=_get_loader(ctx, data_path))
+    generated = generator.generate_all(all_tags or None, all_exclude_tags or None, bundle=bundle)
 
     console.print(f"[bold green]Generated {len(generated)} files:[/bold green]")
     for filename, path in generated.items():
@@ -241,6 +277,7 @@ def generate_all(
         exclude_tags=(),  # Let website use its defaults
         output_dir=website_output_dir,
         data_dir=data_dir,
+        bundle=False,
     )
 
 
@@ -251,11 +288,14 @@ def generate_all(
     default=None,
     help="Path to cv_data/ directory",
 )
-def tags(data_dir: str | None) -> None:
+@click.pass_context
+def tags(ctx: click.Context, data_dir: str | None) -> None:
     """List all available tags from CV data."""
+    from .filters import collect_all_tags_from_loader
+
     data_path = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
 
-    loader = CVDataLoader(data_path)
+    loader = _get_loader(ctx, data_path)
     tags_by_section = collect_all_tags_from_loader(loader)
 
     # Collect all unique tags
@@ -283,13 +323,14 @@ def tags(data_dir: str | None) -> None:
     default=None,
     help="Path to cv_data/ directory",
 )
-def validate(data_dir: str | None) -> None:
+@click.pass_context
+def validate(ctx: click.Context, data_dir: str | None) -> None:
     """Validate CSV data files."""
     data_path = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
 
     console.print(f"[bold blue]Validating CV data in {data_path}...[/bold blue]\n")
 
-    loader = CVDataLoader(data_path)
+    loader = _get_loader(ctx, data_path)
     errors: list[str] = []
 
     # Validate contact
@@ -347,6 +388,34 @@ def validate(data_dir: str | None) -> None:
         console.print("\n[bold green]All files validated successfully![/bold green]")
 
 
+@cli.command(name="compile-data")
+@click.option(
+    "--data-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default=None,
+    help="Path to cv_data/ directory",
+)
+@click.pass_context
+def compile_data(ctx: click.Context, data_dir: str | None) -> None:
+    """Compile CSV data files to Parquet for faster loading.
+
+    Parquet copies are only used while they are newer than their CSV source.
+    """
+    data_path = Path(data_dir) if data_dir else DEFAULT_DATA_DIR
+
+    console.print(f"[bold blue]Compiling CV data in {data_path}...[/bold blue]")
+
+    try:
+        written = _get_loader(ctx, data_path).compile_parquet()
+    except ImportError as e:
+        console.print(f"[bold red]Compile failed:[/bold red] {e}")
+        raise SystemExit(1)
+
+    console.print(f"[bold green]Compiled {len(written)} files:[/bold green]")
+    for path in written:
+        console.print(f"  - {path}")
+
+
 @cli.command(name="build-pdf")
 @click.argument("tex_file", type=click.Path(exists=True), default="maxence_bouvier_resume.tex")
 def build_pdf(tex_file: str) -> None:
@@ -1,9 +1,71 @@
 """Tag-based filtering for CV data."""
 
+import re
+
 import pandas as pd
 
 from .utils import parse_tags
 
+# Pipe separator with surrounding whitespace, collapsed to a bare "|" before splitting
+_TAG_SEPARATOR_PATTERN = re.compile(r"\s*\|\s*")
+
+
+def tags_set_column(tags_column: str = "tags") -> str:
+    """Name of the precomputed frozenset column derived from ``tags_column``."""
+    return f"_{tags_column}_set"
+
+
+def add_tags_set(df: pd.DataFrame, tags_column: str = "tags") -> pd.DataFrame:
+    """
+    Materialize parsed tags once as a frozenset column (e.g. ``_tags_set``).
+
+    Filtering and tag collection reuse this column instead of re-parsing the
+    pipe-separated strings on every call.
+
+    Args:
+        df: DataFrame with a tags column (modified in place)
+        tags_column: Name of the column containing pipe-separated tags
+
+    Returns:
+        The same DataFrame, for chaining
+    """
+    df[tags_set_column(tags_column)] = df[tags_column].map(parse_tags)
+    return df
+
+
+def _tag_indicators(tags: pd.Series) -> pd.DataFrame:
+    """
+    One-hot encode a pipe-separated tags column.
+
+    Tags are lowercased and stripped like in parse_tags, so each resulting
+    column name is a normalized tag and each row marks which tags it carries.
+
+    Args:
+        tags: Series of pipe-separated tag strings (NaN allowed)
+
+    Returns:
+        DataFrame indexed like ``tags`` with one 0/1 column per distinct tag
+    """
+    normalized = (
+        tags.fillna("")
+        .astype(str)
+        .str.lower()
+        .str.replace(_TAG_SEPARATOR_PATTERN, "|", regex=True)
+        .str.strip()
+    )
+    return normalized.str.get_dummies(sep="|")
+
+
+def _has_any_tag(df: pd.DataFrame, tags_column: str, wanted: set[str]) -> pd.Series:
+    """Boolean mask of rows carrying at least one of the ``wanted`` tags."""
+    set_column = tags_set_column(tags_column)
+    if set_column in df.columns:
+        return df[set_column].map(lambda item_tags: not wanted.isdisjoint(item_tags)).astype(bool)
+
+    # No precomputed tag sets (DataFrame not from CVDataLoader): vectorized one-hot path
+    indicators = _tag_indicators(df[tags_column])
+    return indicators.reindex(columns=sorted(wanted), fill_value=0).any(axis=1)
+
 
 def filter_by_tags(df: pd.DataFrame, tags: list[str], tags_column: str = "tags") -> pd.DataFrame:
     """
@@ -23,14 +85,9 @@ def filter_by_tags(df: pd.DataFrame, tags: list[str], tags_column: str = "tags")
     if not tags:
         return df  # No filter = include all
 
+    # Include if 'always' tag present OR any tag matches
     filter_tags = {t.lower() for t in tags}
-
-    def row_matches(row_tags: str) -> bool:
-        item_tags = parse_tags(row_tags)
-        # Include if 'always' tag present OR any tag matches
-        return "always" in item_tags or bool(item_tags & filter_tags)
-
-    mask = df[tags_column].apply(row_matches)
+    mask = _has_any_tag(df, tags_column, filter_tags | {"always"})
     return df[mask]
 
 
@@ -51,14 +108,41 @@ def exclude_by_tags(
     if not exclude_tags:
         return df  # No exclusions = include all
 
+    # Exclude if ANY tag matches
     exclude_set = {t.lower() for t in exclude_tags}
+    mask = ~_has_any_tag(df, tags_column, exclude_set)
+    return df[mask]
+
+
+def select_by_tags(
+    df: pd.DataFrame,
+    tags: list[str] | None,
+    exclude_tags: list[str] | None,
+    tags_column: str = "tags",
+) -> pd.DataFrame:
+    """
+    Apply filter_by_tags and exclude_by_tags in a single pass.
+
+    Both conditions are combined into one boolean mask, so the DataFrame is
+    indexed once instead of materializing an intermediate filtered copy.
 
-    def row_excluded(row_tags: str) -> bool:
-        item_tags = parse_tags(row_tags)
-        # Exclude if ANY tag matches
-        return bool(item_tags & exclude_set)
+    Args:
+        df: DataFrame with a tags column
+        tags: Tags to filter by (OR logic, 'always' forces inclusion); empty = all
+        exclude_tags: Tags to exclude (if ANY match, row is excluded); empty = none
+        tags_column: Name of the column containing pipe-separated tags
 
-    mask = ~df[tags_column].apply(row_excluded)
+    Returns:
+        Filtered DataFrame
+    """
+    if not tags and not exclude_tags:
+        return df
+
+    mask = pd.Series(True, index=df.index)
+    if tags:
+        mask &= _has_any_tag(df, tags_column, {t.lower() for t in tags} | {"always"})
+    if exclude_tags:
+        mask &= ~_has_any_tag(df, tags_column, {t.lower() for t in exclude_tags})
     return df[mask]
 
 
@@ -73,6 +157,10 @@ def get_all_tags(df: pd.DataFrame, tags_column: str = "tags") -> set[str]:
     Returns:
         Set of all unique tags
     """
+    set_column = tags_set_column(tags_column)
+    if set_column in df.columns:
+        return set().union(*df[set_column])
+
     all_tags: set[str] = set()
     for tags_str in df[tags_column].dropna():
         all_tags.update(parse_tags(tags_str))
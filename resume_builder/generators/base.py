@@ -1,11 +1,54 @@
 """Base grouping logic for transforming flat CSV data into hierarchical structures."""
 
-from typing import Any, cast
-
 import pandas as pd
 
 from ..models import GroupedExperience, GroupedSkill
 
+GROUP_COLUMN = "_group"
+
+
+def sort_within_groups(df: pd.DataFrame, keys: str | list[str]) -> pd.DataFrame:
+    """
+    Sort rows by weight (descending) within groups, keeping groups in CSV order.
+
+    Adds a ``_group`` column numbering each group by first appearance, so a single
+    stable sort replaces one sort per group.
+
+    Args:
+        df: DataFrame with a weight column
+        keys: Column(s) defining the groups
+
+    Returns:
+        Sorted copy of the DataFrame with the extra ``_group`` column, already in
+        group order (so later ``groupby(GROUP_COLUMN, sort=False)`` needs no key sort)
+    """
+    # observed=True: categorical keys must not expand to unseen category combinations
+    group_ids = df.groupby(keys, sort=False, observed=True).ngroup()
+    return df.assign(**{GROUP_COLUMN: group_ids}).sort_values(
+        [GROUP_COLUMN, "weight"], ascending=[True, False], kind="stable"
+    )
+
+
+def collect_lists(
+    ordered: pd.DataFrame, column: str, keys: str | list[str] = GROUP_COLUMN
+) -> pd.Series:
+    """
+    Collect ``column`` into one list per group, keeping row order within each group.
+
+    The values are cast to object first, so the lists hold plain Python values
+    whatever the loader's dtypes (pandas 2.x cannot list-aggregate Arrow strings).
+
+    Args:
+        ordered: DataFrame sorted as the lists should be (see sort_within_groups)
+        column: Column whose values are collected
+        keys: Column(s) to group by (default: the ``_group`` ids)
+
+    Returns:
+        Series of lists indexed by the group key(s), in order of first appearance
+    """
+    by = ordered[keys] if isinstance(keys, str) else [ordered[key] for key in keys]
+    return ordered[column].astype(object).groupby(by, sort=False).agg(list)
+
 
 def group_experiences(df: pd.DataFrame) -> list[GroupedExperience]:
     """
@@ -23,53 +66,41 @@ def group_experiences(df: pd.DataFrame) -> list[GroupedExperience]:
     if df.empty:
         return []
 
-    experiences = []
-
-    # Group by job context (preserves CSV order for jobs via sort=False)
-    grouped = df.groupby(["company", "location", "position", "period"], sort=False)
-
-    for key, group in grouped:
-        # Cast key to tuple for type safety (pandas returns tuple for multi-column groupby)
-        key_tuple = cast(tuple[Any, Any, Any, Any], key)
-        company, loc, pos, period = (
-            str(key_tuple[0]),
-            str(key_tuple[1]),
-            str(key_tuple[2]),
-            str(key_tuple[3]),
+    # Sort once (jobs keep CSV order, bullets by weight), then collect one row per job
+    ordered = sort_within_groups(df, ["company", "location", "position", "period"])
+    jobs = (
+        ordered.groupby(GROUP_COLUMN, sort=False)
+        .agg(
+            company=("company", "first"),
+            location=("location", "first"),
+            position=("position", "first"),
+            period=("period", "first"),
         )
-        # Sort bullets by weight within the job (descending = highest first)
-        sorted_group = group.sort_values("weight", ascending=False)
-
-        # Group achievements by achievement_group if present
-        achievement_groups: dict[str, list[str]] = {}
-        ungrouped_achievements: list[str] = []
-
-        for _, row in sorted_group.iterrows():
-            text = row["achievement_text"]
-            group_name = row.get("achievement_group", "")
-
-            if group_name and pd.notna(group_name) and group_name.strip():
-                achievement_groups.setdefault(group_name, []).append(text)
-            else:
-                ungrouped_achievements.append(text)
-
-        # Flatten all achievements for simple rendering
-        all_achievements = ungrouped_achievements.copy()
-        for group_achievements in achievement_groups.values():
-            all_achievements.extend(group_achievements)
-
-        experiences.append(
-            GroupedExperience(
-                company=company,
-                location=loc,
-                position=pos,
-                period=period,
-                achievements=sorted_group["achievement_text"].tolist(),
-                achievement_groups=achievement_groups,
-            )
+        .assign(achievements=collect_lists(ordered, "achievement_text"))
+    )
+
+    # Group achievements by achievement_group if present: (job, group) -> texts
+    achievement_groups_by_job: dict[int, dict[str, list[str]]] = {}
+    if "achievement_group" in ordered.columns:
+        group_names = ordered["achievement_group"]
+        has_group = group_names.notna() & group_names.astype(str).str.strip().ne("")
+        grouped_texts = collect_lists(
+            ordered.loc[has_group], "achievement_text", [GROUP_COLUMN, "achievement_group"]
         )
-
-    return experiences
+        for (job_id, group_name), texts in grouped_texts.items():
+            achievement_groups_by_job.setdefault(job_id, {})[group_name] = texts
+
+    return [
+        GroupedExperience(
+            company=str(company),
+            location=str(loc),
+            position=str(pos),
+            period=str(period),
+            achievements=achievements,
+            achievement_groups=achievement_groups_by_job.get(job_id, {}),
+        )
+        for job_id, company, loc, pos, period, achievements in jobs.itertuples(name=None)
+    ]
 
 
 def group_skills(df: pd.DataFrame) -> list[GroupedSkill]:
@@ -87,34 +118,33 @@ def group_skills(df: pd.DataFrame) -> list[GroupedSkill]:
     if df.empty:
         return []
 
-    skills = []
-
-    # Group by category (preserves order)
-    grouped = df.groupby("category", sort=False)
-
-    for cat_key, group in grouped:
-        category = str(cat_key)
-        # Sort skills by weight within category (descending)
-        sorted_group = group.sort_values("weight", ascending=False)
-
-        # Get icon from first row (all rows in category should have same icon)
-        icon = sorted_group.iloc[0]["icon"] if "icon" in sorted_group.columns else "Code"
-
-        skills.append(
-            GroupedSkill(
-                category=category,
-                icon=icon,
-                skills=sorted_group["skill"].tolist(),
-            )
+    if "icon" not in df.columns:
+        df = df.assign(icon="Code")
+
+    # Sort once (categories keep CSV order, skills by weight), then one row per category.
+    # Icon comes from the first row (all rows in a category should share it).
+    ordered = sort_within_groups(df, "category")
+    categories = (
+        ordered.groupby(GROUP_COLUMN, sort=False)
+        .agg(
+            category=("category", "first"),
+            icon=("icon", "first"),
         )
+        .assign(skills=collect_lists(ordered, "skill"))
+    )
 
-    return skills
+    return [
+        GroupedSkill(category=str(category), icon=icon, skills=skills)
+        for category, icon, skills in categories.itertuples(index=False, name=None)
+    ]
 
 
 def sort_by_weight(df: pd.DataFrame) -> pd.DataFrame:
     """
     Sort DataFrame by weight column (descending).
 
+    The sort is stable, so rows with equal weight keep their CSV order.
+
     Args:
         df: DataFrame with weight column
 
@@ -122,5 +152,5 @@ def sort_by_weight(df: pd.DataFrame) -> pd.DataFrame:
         Sorted DataFrame
     """
     if "weight" in df.columns:
-        return df.sort_values("weight", ascending=False)
+        return df.sort_values("weight", ascending=False, kind="stable")
     return df
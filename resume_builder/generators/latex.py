@@ -1,16 +1,46 @@
 """LaTeX CV generator using Jinja2 templates."""
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import pandas as pd
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from ..filters import exclude_by_tags, filter_by_tags
+from ..filters import select_by_tags
 from ..loader import CVDataLoader
 from ..models import CVData, Education, Patent, Publication
 from ..utils import escape_latex, format_period_latex
 from .base import group_experiences, group_skills, sort_by_weight
 
 
+def _prepare(
+    df: pd.DataFrame,
+    tags: list[str] | None,
+    exclude_tags: list[str] | None,
+    weight_sort: bool = False,
+) -> pd.DataFrame:
+    """Filter by include/exclude tags in one pass, optionally sorting by weight."""
+    df = select_by_tags(df, tags, exclude_tags)
+    return sort_by_weight(df) if weight_sort else df
+
+
+@functools.lru_cache(maxsize=8)
+def _get_env(template_dir: str) -> Environment:
+    """Build (once per directory) the Jinja2 environment with the LaTeX filters registered."""
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(disabled_extensions=["tex", "j2"]),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+    # Register custom filters
+    env.filters["escape_tex"] = escape_latex
+    env.filters["format_period"] = format_period_latex
+    return env
+
+
 class LaTeXGenerator:
     """Generate LaTeX CV from CSV data with tag-based filtering."""
 
@@ -19,6 +49,7 @@ class LaTeXGenerator:
         data_dir: Path | str,
         template_dir: Path | str | None = None,
         template_name: str = "resume.tex.j2",
+        loader: CVDataLoader | None = None,
     ):
         """
         Initialize LaTeX generator.
@@ -27,25 +58,18 @@ class LaTeXGenerator:
             data_dir: Path to cv_data/ directory
             template_dir: Path to templates/ directory (defaults to sibling of data_dir)
             template_name: Name of Jinja2 template file
+            loader: Existing CVDataLoader to reuse (shares its cached data)
         """
         self.data_dir = Path(data_dir)
         self.template_dir = (
             Path(template_dir) if template_dir else self.data_dir.parent / "templates"
         )
         self.template_name = template_name
-        self.loader = CVDataLoader(self.data_dir)
-
-        # Set up Jinja2 environment
-        self.env = Environment(
-            loader=FileSystemLoader(self.template_dir),
-            autoescape=select_autoescape(disabled_extensions=["tex", "j2"]),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self.loader = loader or CVDataLoader(self.data_dir)
 
-        # Register custom filters
-        self.env.filters["escape_tex"] = escape_latex
-        self.env.filters["format_period"] = format_period_latex
+        # Jinja2 environment is shared per template directory; compile the template once
+        self.env = _get_env(str(self.template_dir))
+        self._template = self.env.get_template(self.template_name)
 
     def generate(
         self,
@@ -68,8 +92,7 @@ class LaTeXGenerator:
         cv_data = self._load_and_process_data(tags or [], summary_variant, exclude_tags or [])
 
         # Render template
-        template = self.env.get_template(self.template_name)
-        return template.render(cv=cv_data)
+        return self._template.render(cv=cv_data)
 
     def generate_to_file(
         self,
@@ -93,64 +116,43 @@ class LaTeXGenerator:
         output_path = Path(output_path)
         content = self.generate(tags, summary_variant, exclude_tags)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content)
+        output_path.write_text(content, encoding="utf-8")
         return output_path
 
     def _load_and_process_data(
         self, tags: list[str], summary_variant: str, exclude_tags: list[str]
     ) -> CVData:
         """Load, filter, and group CV data."""
-        # Load contact (always included)
-        contact = self.loader.load_contact()
-
-        # Load summary
-        summary = self.loader.load_summary(summary_variant)
-
-        # Load and filter experiences
-        exp_df = self.loader.load_experiences()
-        if tags:
-            exp_df = filter_by_tags(exp_df, tags)
-        if exclude_tags:
-            exp_df = exclude_by_tags(exp_df, exclude_tags)
-        experiences = group_experiences(exp_df)
-
-        # Load and filter skills
-        skills_df = self.loader.load_skills()
-        if tags:
-            skills_df = filter_by_tags(skills_df, tags)
-        if exclude_tags:
-            skills_df = exclude_by_tags(skills_df, exclude_tags)
-        skills = group_skills(skills_df)
-
-        # Load and filter education
-        education_df = self.loader.load_education()
-        if tags:
-            education_df = filter_by_tags(education_df, tags)
-        if exclude_tags:
-            education_df = exclude_by_tags(education_df, exclude_tags)
-        education = [Education(**row.to_dict()) for _, row in education_df.iterrows()]
-
-        # Load and filter patents
-        patents_df = self.loader.load_patents()
-        if tags:
-            patents_df = filter_by_tags(patents_df, tags)
-        if exclude_tags:
-            patents_df = exclude_by_tags(patents_df, exclude_tags)
-        patents_df = sort_by_weight(patents_df)
-        patents = [Patent(**row.to_dict()) for _, row in patents_df.iterrows()]
-
-        # Load and filter publications
-        pubs_df = self.loader.load_publications()
-        if tags:
-            pubs_df = filter_by_tags(pubs_df, tags)
-        if exclude_tags:
-            pubs_df = exclude_by_tags(pubs_df, exclude_tags)
-        pubs_df = sort_by_weight(pubs_df)
-        publications = [Publication(**row.to_dict()) for _, row in pubs_df.iterrows()]
+        # Read every CSV concurrently (independent I/O; the pandas parser releases the GIL)
+        loaders = {
+            "contact": self.loader.load_contact,
+            "summary": functools.partial(self.loader.load_summary, summary_variant),
+            "experiences": self.loader.load_experiences,
+            "skills": self.loader.load_skills,
+            "education": self.loader.load_education,
+            "patents": self.loader.load_patents,
+            "publications": self.loader.load_publications,
+        }
+        with ThreadPoolExecutor(max_workers=len(loaders)) as executor:
+            futures = {name: executor.submit(load) for name, load in loaders.items()}
+            loaded = {name: future.result() for name, future in futures.items()}
+
+        # Filter and group/sort each section
+        experiences = group_experiences(_prepare(loaded["experiences"], tags, exclude_tags))
+        skills = group_skills(_prepare(loaded["skills"], tags, exclude_tags))
+
+        education_df = _prepare(loaded["education"], tags, exclude_tags)
+        education = [Education(**rec) for rec in education_df.to_dict(orient="records")]
+
+        patents_df = _prepare(loaded["patents"], tags, exclude_tags, weight_sort=True)
+        patents = [Patent(**rec) for rec in patents_df.to_dict(orient="records")]
+
+        pubs_df = _prepare(loaded["publications"], tags, exclude_tags, weight_sort=True)
+        publications = [Publication(**rec) for rec in pubs_df.to_dict(orient="records")]
 
         return CVData(
-            contact=contact,
-            summary=summary,
+            contact=loaded["contact"],
+            summary=loaded["summary"],
             experiences=experiences,
             skills=skills,
             education=education,
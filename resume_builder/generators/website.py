@@ -1,33 +1,83 @@
 """Website JSON generator for React components."""
 
+import functools
 import json
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional (pip install resume-builder[fast])
+    orjson = None
 
-from ..filters import exclude_by_tags, filter_by_tags
+import pandas as pd
+
+from ..filters import select_by_tags
 from ..loader import CVDataLoader
-from .base import group_skills, sort_by_weight
+from .base import GROUP_COLUMN, collect_lists, group_skills, sort_by_weight, sort_within_groups
+
+# Contact fields published on the website (location and links stay CV-only)
+_WEBSITE_CONTACT_FIELDS = frozenset({"name", "email", "phone", "linkedin", "scholar"})
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to 2-space indented UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _dump_json(obj: Any, path: Path) -> None:
+    """Write ``obj`` to ``path`` as 2-space indented UTF-8 JSON."""
+    path.write_bytes(_dumps(obj))
+
+
+def _dump_json_records(records: Iterable[Any], path: Path) -> None:
+    """
+    Write ``records`` to ``path`` as a JSON array, serializing one record at a time.
+
+    Each record is dumped straight into a byte buffer as it is produced, so the
+    full list of dicts never has to exist. The layout matches ``_dump_json``.
+    """
+    buf = bytearray(b"[")
+    sep = b"\n  "
+    for record in records:
+        buf += sep
+        # Nest the record one level deeper; JSON strings never contain raw newlines
+        buf += _dumps(record).replace(b"\n", b"\n  ")
+        sep = b",\n  "
+    buf += b"\n]" if len(buf) > 1 else b"]"
+    path.write_bytes(buf)
 
 
 class WebsiteGenerator:
     """Generate JSON data files for React website."""
 
-    def __init__(self, data_dir: Path | str, output_dir: Path | str):
+    def __init__(
+        self,
+        data_dir: Path | str,
+        output_dir: Path | str,
+        loader: CVDataLoader | None = None,
+    ):
         """
         Initialize website generator.
 
         Args:
             data_dir: Path to cv_data/ directory
             output_dir: Path to website's src/data/ directory
+            loader: Existing CVDataLoader to reuse (shares its cached data)
         """
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
-        self.loader = CVDataLoader(self.data_dir)
+        self.loader = loader or CVDataLoader(self.data_dir)
 
     def generate_all(
         self,
         tags: list[str] | None = None,
         exclude_tags: list[str] | None = None,
+        bundle: bool = False,
     ) -> dict[str, Path]:
         """
         Generate all JSON data files for the website.
@@ -35,93 +85,168 @@ class WebsiteGenerator:
         Args:
             tags: Optional tag filter (include if ANY match)
             exclude_tags: Optional tags to exclude (exclude if ANY match)
+            bundle: Also write site_data.json (see generate_bundle) from the same payloads
 
         Returns:
             Dictionary mapping filename to output path
         """
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        generated = {}
 
-        generated["experiences.json"] = self._generate_experiences(tags, exclude_tags)
-        generated["skills.json"] = self._generate_skills(tags, exclude_tags)
-        generated["publications.json"] = self._generate_publications(tags, exclude_tags)
-        generated["contact.json"] = self._generate_contact()
+        if bundle:
+            # Build every section once and write both the per-section files and the bundle
+            payload = self._build_payload(tags, exclude_tags)
+            generated = {}
+            for section, data in payload.items():
+                generated[f"{section}.json"] = self.output_dir / f"{section}.json"
+                _dump_json(data, generated[f"{section}.json"])
+            generated["site_data.json"] = self.output_dir / "site_data.json"
+            _dump_json(payload, generated["site_data.json"])
+            return generated
+
+        # Each file reads its own CSV and writes its own output, so they run concurrently
+        jobs = {
+            "experiences.json": functools.partial(self._generate_experiences, tags, exclude_tags),
+            "skills.json": functools.partial(self._generate_skills, tags, exclude_tags),
+            "publications.json": functools.partial(self._generate_publications, tags, exclude_tags),
+            "contact.json": self._generate_contact,
+        }
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(job) for name, job in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
+
+    def generate_bundle(
+        self,
+        tags: list[str] | None = None,
+        exclude_tags: list[str] | None = None,
+    ) -> Path:
+        """
+        Generate a single site_data.json holding every section of the website data.
+
+        The file is ``{"experiences": [...], "skills": [...], "publications": [...],
+        "contact": {...}}`` with the same content as the per-section files, so the
+        client can fetch everything at once.
+
+        Args:
+            tags: Optional tag filter (include if ANY match)
+            exclude_tags: Optional tags to exclude (exclude if ANY match)
+
+        Returns:
+            Path to generated file
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = self.output_dir / "site_data.json"
+        _dump_json(self._build_payload(tags, exclude_tags), output_path)
+        return output_path
 
-        return generated
+    def _build_payload(
+        self, tags: list[str] | None, exclude_tags: list[str] | None
+    ) -> dict[str, Any]:
+        """Build every website section, keyed by section name (in file order)."""
+        # Build the sections concurrently: each reads its own CSV
+        jobs = {
+            "experiences": functools.partial(self._build_experiences_payload, tags, exclude_tags),
+            "skills": functools.partial(self._build_skills_payload, tags, exclude_tags),
+            "publications": functools.partial(self._build_publications_payload, tags, exclude_tags),
+            "contact": self._build_contact_payload,
+        }
+        with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+            futures = {name: executor.submit(job) for name, job in jobs.items()}
+            return {name: future.result() for name, future in futures.items()}
 
     def _generate_experiences(self, tags: list[str] | None, exclude_tags: list[str] | None) -> Path:
         """Generate experiences.json for website."""
-        df = self.loader.load_experiences()
-        if tags:
-            df = filter_by_tags(df, tags)
-        if exclude_tags:
-            df = exclude_by_tags(df, exclude_tags)
+        output_path = self.output_dir / "experiences.json"
+        _dump_json_records(self._build_experiences_payload(tags, exclude_tags), output_path)
+        return output_path
+
+    def _generate_skills(self, tags: list[str] | None, exclude_tags: list[str] | None) -> Path:
+        """Generate skills.json for website."""
+        output_path = self.output_dir / "skills.json"
+        _dump_json(self._build_skills_payload(tags, exclude_tags), output_path)
+        return output_path
+
+    def _generate_publications(
+        self, tags: list[str] | None, exclude_tags: list[str] | None
+    ) -> Path:
+        """Generate publications.json for website."""
+        output_path = self.output_dir / "publications.json"
+        _dump_json_records(self._build_publications_payload(tags, exclude_tags), output_path)
+        return output_path
+
+    def _generate_contact(self) -> Path:
+        """Generate contact.json for website."""
+        output_path = self.output_dir / "contact.json"
+        _dump_json(self._build_contact_payload(), output_path)
+        return output_path
 
-        # Group by job but handle multi-position companies like SONY
-        experiences = []
+    def _build_experiences_payload(
+        self, tags: list[str] | None, exclude_tags: list[str] | None
+    ) -> list[dict[str, Any]]:
+        """Build the website experience records (one per company)."""
+        df = self.loader.load_experiences()
+        df = select_by_tags(df, tags, exclude_tags)
 
-        # First group by company to detect multi-position entries
-        company_groups = df.groupby("company", sort=False)
+        # Company location for multi-position entries comes from its first CSV row
+        first_rows = df.drop_duplicates("company")
+        locations = dict(zip(first_rows["company"], first_rows["location"]))
 
-        for company, company_df in company_groups:
-            # Check if company has multiple positions
-            positions = company_df[["position", "period"]].drop_duplicates()
+        # One sorted pass: positions keep CSV order, achievements sorted by weight
+        ordered = sort_within_groups(df, ["company", "position", "period"])
+        positions = (
+            ordered.groupby(GROUP_COLUMN, sort=False)
+            .agg(
+                company=("company", "first"),
+                position=("position", "first"),
+                period=("period", "first"),
+                location=("location", "first"),
+            )
+            .assign(achievements=collect_lists(ordered, "achievement_text"))
+        )
+        return list(self._experience_records(positions, locations))
 
-            if len(positions) > 1:
+    @staticmethod
+    def _experience_records(
+        positions: pd.DataFrame, locations: dict[str, str]
+    ) -> Iterator[dict[str, Any]]:
+        """Yield one website record per company, nesting positions for multi-position ones."""
+        # Group by company to detect multi-position entries (like SONY)
+        for company, company_positions in positions.groupby("company", sort=False, observed=True):
+            if len(company_positions) > 1:
                 # Multi-position company (like SONY)
-                location = company_df.iloc[0]["location"]
-                positions_list = []
-
-                for _, pos_row in positions.iterrows():
-                    pos_df = company_df[
-                        (company_df["position"] == pos_row["position"])
-                        & (company_df["period"] == pos_row["period"])
-                    ].sort_values("weight", ascending=False)
-
-                    positions_list.append(
-                        {
-                            "title": pos_row["position"],
-                            "period": pos_row["period"],
-                            "achievements": pos_df["achievement_text"].tolist(),
-                        }
-                    )
-
-                experiences.append(
-                    {
-                        "company": company,
-                        "location": location,
-                        "positions": positions_list,
-                    }
-                )
+                yield {
+                    "company": company,
+                    "location": locations[company],
+                    "positions": [
+                        {"title": title, "period": period, "achievements": achievements}
+                        for title, period, achievements in company_positions[
+                            ["position", "period", "achievements"]
+                        ].itertuples(index=False, name=None)
+                    ],
+                }
             else:
                 # Single position company
-                sorted_df = company_df.sort_values("weight", ascending=False)
-                experiences.append(
-                    {
-                        "company": company,
-                        "position": sorted_df.iloc[0]["position"],
-                        "location": sorted_df.iloc[0]["location"],
-                        "period": sorted_df.iloc[0]["period"],
-                        "achievements": sorted_df["achievement_text"].tolist(),
-                    }
+                _, position, period, location, achievements = next(
+                    company_positions.itertuples(index=False, name=None)
                 )
+                yield {
+                    "company": company,
+                    "position": position,
+                    "location": location,
+                    "period": period,
+                    "achievements": achievements,
+                }
 
-        output_path = self.output_dir / "experiences.json"
-        output_path.write_text(json.dumps(experiences, indent=2))
-        return output_path
-
-    def _generate_skills(self, tags: list[str] | None, exclude_tags: list[str] | None) -> Path:
-        """Generate skills.json for website."""
+    def _build_skills_payload(
+        self, tags: list[str] | None, exclude_tags: list[str] | None
+    ) -> list[dict[str, Any]]:
+        """Build the website skill cards (one per category)."""
         df = self.loader.load_skills()
-        if tags:
-            df = filter_by_tags(df, tags)
-        if exclude_tags:
-            df = exclude_by_tags(df, exclude_tags)
+        df = select_by_tags(df, tags, exclude_tags)
 
         grouped = group_skills(df)
 
         # Convert to website format with icon mapping
-        skills_data = [
+        return [
             {
                 "icon": skill.icon,
                 "title": skill.category,
@@ -130,49 +255,27 @@ class WebsiteGenerator:
             for skill in grouped
         ]
 
-        output_path = self.output_dir / "skills.json"
-        output_path.write_text(json.dumps(skills_data, indent=2))
-        return output_path
-
-    def _generate_publications(
+    def _build_publications_payload(
         self, tags: list[str] | None, exclude_tags: list[str] | None
-    ) -> Path:
-        """Generate publications.json for website."""
+    ) -> list[dict[str, Any]]:
+        """Build the website publication records, heaviest weight first."""
         df = self.loader.load_publications()
-        if tags:
-            df = filter_by_tags(df, tags)
-        if exclude_tags:
-            df = exclude_by_tags(df, exclude_tags)
+        df = select_by_tags(df, tags, exclude_tags)
         df = sort_by_weight(df)
 
-        publications = []
-        for _, row in df.iterrows():
-            publications.append(
-                {
-                    "authors": row["authors"],
-                    "title": row["title"],
-                    "venue": row["venue"],
-                    "year": int(row["year"]),
-                    "url": row["url"],
-                }
+        # Column-wise tolist() yields native Python values (int years) in one pass each
+        return [
+            {"authors": authors, "title": title, "venue": venue, "year": year, "url": url}
+            for authors, title, venue, year, url in zip(
+                df["authors"].tolist(),
+                df["title"].tolist(),
+                df["venue"].tolist(),
+                df["year"].astype(int).tolist(),
+                df["url"].tolist(),
             )
+        ]
 
-        output_path = self.output_dir / "publications.json"
-        output_path.write_text(json.dumps(publications, indent=2))
-        return output_path
-
-    def _generate_contact(self) -> Path:
-        """Generate contact.json for website."""
+    def _build_contact_payload(self) -> dict[str, Any]:
+        """Build the public contact details."""
         contact = self.loader.load_contact()
-
-        contact_data = {
-            "name": contact.name,
-            "email": contact.email,
-            "phone": contact.phone,
-            "linkedin": contact.linkedin,
-            "scholar": contact.scholar,
-        }
-
-        output_path = self.output_dir / "contact.json"
-        output_path.write_text(json.dumps(contact_data, indent=2))
-        return output_path
+        return contact.model_dump(include=_WEBSITE_CONTACT_FIELDS)
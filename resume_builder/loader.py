@@ -1,12 +1,122 @@
 """CSV data loader with validation."""
 
+import functools
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, TypeVar, cast
 
 import pandas as pd
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
+from .filters import add_tags_set
 from .models import Contact, Experience, Patent, Publication, Skill
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+except ImportError:  # pyarrow is optional (pip install resume-builder[fast])
+    pa = None
+    pa_csv = None
+
+# Explicit types for numeric CSV columns (other columns are inferred)
+_CSV_COLUMN_TYPES: dict[str, dict[str, str]] = {
+    "experiences.csv": {"papers": "int64", "patents": "int64", "weight": "int64"},
+    "skills.csv": {"weight": "int64"},
+    "patents.csv": {"year": "int64", "weight": "int64"},
+    "publications.csv": {"year": "int64", "weight": "int64"},
+}
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Batch validators: a whole table is validated in one pydantic-core call
+_EXPERIENCES_ADAPTER = TypeAdapter(list[Experience])
+_SKILLS_ADAPTER = TypeAdapter(list[Skill])
+_PATENTS_ADAPTER = TypeAdapter(list[Patent])
+_PUBLICATIONS_ADAPTER = TypeAdapter(list[Publication])
+
+
+def _validate_rows(adapter: TypeAdapter[Any], df: pd.DataFrame) -> list[str]:
+    """
+    Validate every row of ``df`` at once and describe the invalid ones.
+
+    Args:
+        adapter: TypeAdapter for a list of the row model
+        df: DataFrame whose records should match the model
+
+    Returns:
+        One "Row <index>: <field>: <message>" entry per invalid row (empty if valid)
+    """
+    try:
+        adapter.validate_python(df.to_dict(orient="records"))
+    except ValidationError as e:
+        # loc is (list position, field, ...): group the messages by DataFrame row
+        by_row: dict[Any, list[str]] = {}
+        for error in e.errors():
+            position, *field = error["loc"]
+            location = ".".join(str(part) for part in field)
+            by_row.setdefault(df.index[position], []).append(f"{location}: {error['msg']}")
+        return [f"Row {idx}: {'; '.join(messages)}" for idx, messages in by_row.items()]
+    return []
+
+
+def _type_null_columns(df: pd.DataFrame, filename: str) -> pd.DataFrame:
+    """
+    Give Arrow ``null``-typed columns (blank in every row) a concrete type.
+
+    Arrow infers an all-blank column as type ``null``, which cannot be filled with a
+    default. Such columns get their declared type from _CSV_COLUMN_TYPES, or string.
+
+    Args:
+        df: DataFrame read with Arrow-backed dtypes
+        filename: CSV file the data comes from (selects the declared types)
+    """
+    declared = _CSV_COLUMN_TYPES.get(filename, {})
+    null_columns = {
+        column: pd.ArrowDtype(pa.type_for_alias(declared.get(column, "string")))
+        for column, dtype in df.dtypes.items()
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype)
+    }
+    return df.astype(null_columns) if null_columns else df
+
+
+def _cached_on_mtime(filename: str) -> Callable[[_F], _F]:
+    """
+    Memoize a loader method per arguments until ``filename`` changes on disk.
+
+    Every call returns its own copy of the cached value (a deep copy for DataFrames,
+    ``model_copy`` for models), so callers may modify the result, even in place,
+    without affecting later loads.
+
+    Args:
+        filename: CSV file (relative to the data directory) the method reads
+    """
+
+    def decorator(method: _F) -> _F:
+        @functools.wraps(method)
+        def wrapper(self: "CVDataLoader", *args: Any, **kwargs: Any) -> Any:
+            try:
+                mtime = (self.data_dir / filename).stat().st_mtime_ns
+            except FileNotFoundError:
+                # Let the method raise (or handle) the missing file itself
+                return method(self, *args, **kwargs)
+
+            key = (method.__name__, args, tuple(sorted(kwargs.items())))
+            hit = self._cache.get(key)
+            if hit is None or hit[0] != mtime:
+                hit = (mtime, method(self, *args, **kwargs))
+                self._cache[key] = hit
+
+            value = hit[1]
+            if isinstance(value, pd.DataFrame):
+                return value.copy(deep=True)
+            if isinstance(value, BaseModel):
+                return value.model_copy()
+            return value
+
+        return cast(_F, wrapper)
+
+    return decorator
+
 
 class CVDataLoader:
     """Load and validate CV data from CSV files."""
@@ -21,70 +131,190 @@ class CVDataLoader:
         self.data_dir = Path(data_dir)
         if not self.data_dir.exists():
             raise FileNotFoundError(f"Data directory not found: {self.data_dir}")
+        # (method name, args, kwargs) -> (file mtime_ns, loaded value)
+        self._cache: dict[tuple[Any, ...], tuple[int, Any]] = {}
 
-    def _read_csv(self, filename: str) -> pd.DataFrame:
-        """Read a CSV file from the data directory."""
+    def invalidate(self) -> None:
+        """Drop all memoized data so the next load_* call re-reads the CSV files."""
+        self._cache.clear()
+
+    def _read_csv(self, filename: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """Read a CSV file from the data directory (optionally only ``columns``)."""
         filepath = self.data_dir / filename
         if not filepath.exists():
             raise FileNotFoundError(f"CSV file not found: {filepath}")
-        return pd.read_csv(filepath)
+        if pa is not None and pa_csv is not None:
+            # Arrow's multithreaded reader with a typed schema. Empty cells are null in
+            # every column, like pandas' NaN, so blank required fields still fail validation
+            column_types = {
+                column: pa.type_for_alias(type_name)
+                for column, type_name in _CSV_COLUMN_TYPES.get(filename, {}).items()
+            }
+            try:
+                table = pa_csv.read_csv(
+                    filepath,
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(
+                        column_types=column_types,
+                        null_values=[""],
+                        strings_can_be_null=True,
+                        include_columns=columns or [],
+                    ),
+                )
+                # Arrow-backed dtypes keep text columns as contiguous UTF-8 buffers
+                return _type_null_columns(table.to_pandas(types_mapper=pd.ArrowDtype), filename)
+            except pa.ArrowInvalid:
+                # Malformed values (e.g. non-numeric year): use the lenient pandas
+                # parser so validation can report the offending rows
+                pass
+
+        if pa is not None:
+            df = pd.read_csv(filepath, usecols=columns, dtype_backend="pyarrow")
+            df = _type_null_columns(df, filename)
+        else:
+            df = pd.read_csv(filepath, usecols=columns)
+        return df[columns] if columns else df
+
+    def _read_table(self, name: str, columns: list[str] | None = None) -> pd.DataFrame:
+        """
+        Read a data table, preferring its compiled Parquet copy over the CSV.
+
+        The ``<name>.parquet`` file (see compile_parquet) is only used when pyarrow is
+        available and it is at least as recent as ``<name>.csv``, so edits to the CSV
+        source of truth are never shadowed by a stale copy.
+
+        Args:
+            name: Table name without extension (e.g. "experiences")
+            columns: Columns to read (None = all)
+        """
+        csv_path = self.data_dir / f"{name}.csv"
+        parquet_path = self.data_dir / f"{name}.parquet"
+        if (
+            pa is not None
+            and csv_path.exists()
+            and parquet_path.exists()
+            and parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns
+        ):
+            df = pd.read_parquet(
+                parquet_path, columns=columns, engine="pyarrow", dtype_backend="pyarrow"
+            )
+            return _type_null_columns(df, csv_path.name)
+        return self._read_csv(csv_path.name, columns)
+
+    def compile_parquet(self) -> list[Path]:
+        """
+        Write a Snappy-compressed, single row-group Parquet copy of every CSV file.
+
+        Returns:
+            Paths of the written Parquet files
+        """
+        if pa is None:
+            raise ImportError("Compiling data requires pyarrow (pip install resume-builder[fast])")
+
+        written = []
+        for csv_path in sorted(self.data_dir.glob("*.csv")):
+            df = self._read_csv(csv_path.name)
+            parquet_path = csv_path.with_suffix(".parquet")
+            df.to_parquet(
+                parquet_path,
+                engine="pyarrow",
+                compression="snappy",
+                index=False,
+                row_group_size=max(len(df), 1),
+            )
+            written.append(parquet_path)
+        return written
 
+    @_cached_on_mtime("contact.csv")
     def load_contact(self) -> Contact:
         """Load contact information."""
-        df = self._read_csv("contact.csv")
+        df = self._read_table("contact")
         if df.empty:
             raise ValueError("contact.csv is empty")
         row = df.iloc[0].to_dict()
         return Contact(**row)
 
+    @_cached_on_mtime("summary.csv")
     def load_summary(self, variant: str = "default") -> str:
         """Load summary text for a specific variant."""
         try:
-            df = self._read_csv("summary.csv")
-            summaries = {row["variant"]: row["text"] for _, row in df.iterrows()}
+            df = self._read_table("summary", columns=["variant", "text"])
+            summaries = dict(zip(df["variant"], df["text"]))
             return summaries.get(variant, summaries.get("default", ""))
         except FileNotFoundError:
             return ""
 
+    @_cached_on_mtime("experiences.csv")
     def load_experiences(self) -> pd.DataFrame:
         """Load experiences as DataFrame (for filtering/grouping)."""
-        df = self._read_csv("experiences.csv")
-        # Fill NaN values
-        df["achievement_group"] = df["achievement_group"].fillna("")
-        df["tags"] = df["tags"].fillna("")
-        df["weight"] = df["weight"].fillna(0).astype(int)
-        df["papers"] = df["papers"].fillna(0).astype(int)
-        df["patents"] = df["patents"].fillna(0).astype(int)
-        return df
+        df = self._read_table(
+            "experiences",
+            columns=[
+                "company",
+                "location",
+                "position",
+                "period",
+                "achievement_group",
+                "achievement_text",
+                "papers",
+                "patents",
+                "tags",
+                "weight",
+            ],
+        )
+        # Fill NaN values (one pass for all columns); the few distinct job fields are
+        # dictionary-encoded so grouping compares integer codes instead of strings
+        df = df.fillna(
+            {"achievement_group": "", "tags": "", "weight": 0, "papers": 0, "patents": 0}
+        ).astype(
+            {
+                "weight": int,
+                "papers": int,
+                "patents": int,
+                "company": "category",
+                "location": "category",
+                "position": "category",
+                "period": "category",
+            }
+        )
+        return add_tags_set(df)
 
+    @_cached_on_mtime("skills.csv")
     def load_skills(self) -> pd.DataFrame:
         """Load skills as DataFrame (for filtering/grouping)."""
-        df = self._read_csv("skills.csv")
-        df["tags"] = df["tags"].fillna("")
-        df["icon"] = df["icon"].fillna("Code")
-        df["weight"] = df["weight"].fillna(0).astype(int)
-        return df
+        df = self._read_table("skills", columns=["category", "skill", "tags", "icon", "weight"])
+        df = df.fillna({"tags": "", "icon": "Code", "weight": 0}).astype(
+            {"weight": int, "category": "category", "icon": "category"}
+        )
+        return add_tags_set(df)
 
+    @_cached_on_mtime("education.csv")
     def load_education(self) -> pd.DataFrame:
         """Load education as DataFrame (for filtering)."""
-        df = self._read_csv("education.csv")
-        df["tags"] = df["tags"].fillna("")
-        df["description"] = df["description"].fillna("")
-        return df
+        df = self._read_table(
+            "education",
+            columns=["institution", "location", "degree", "period", "description", "tags"],
+        )
+        df = df.fillna({"tags": "", "description": ""})
+        return add_tags_set(df)
 
+    @_cached_on_mtime("patents.csv")
     def load_patents(self) -> pd.DataFrame:
         """Load patents as DataFrame (for filtering)."""
-        df = self._read_csv("patents.csv")
-        df["tags"] = df["tags"].fillna("")
-        df["weight"] = df["weight"].fillna(0).astype(int)
-        return df
+        df = self._read_table(
+            "patents", columns=["authors", "title", "reference", "url", "year", "tags", "weight"]
+        )
+        df = df.fillna({"tags": "", "weight": 0}).astype({"weight": int})
+        return add_tags_set(df)
 
+    @_cached_on_mtime("publications.csv")
     def load_publications(self) -> pd.DataFrame:
         """Load publications as DataFrame (for filtering)."""
-        df = self._read_csv("publications.csv")
-        df["tags"] = df["tags"].fillna("")
-        df["weight"] = df["weight"].fillna(0).astype(int)
-        return df
+        df = self._read_table(
+            "publications", columns=["authors", "title", "venue", "year", "url", "tags", "weight"]
+        )
+        df = df.fillna({"tags": "", "weight": 0}).astype({"weight": int})
+        return add_tags_set(df)
 
     def validate_all(self) -> dict[str, list[str]]:
         """
@@ -103,23 +333,17 @@ class CVDataLoader:
 
         # Validate experiences
         try:
-            df = self.load_experiences()
-            for idx, row in df.iterrows():
-                try:
-                    Experience(**row.to_dict())
-                except ValidationError as e:
-                    errors.setdefault("experiences.csv", []).append(f"Row {idx}: {e}")
+            row_errors = _validate_rows(_EXPERIENCES_ADAPTER, self.load_experiences())
+            if row_errors:
+                errors["experiences.csv"] = row_errors
         except FileNotFoundError as e:
             errors["experiences.csv"] = [str(e)]
 
         # Validate skills
         try:
-            df = self.load_skills()
-            for idx, row in df.iterrows():
-                try:
-                    Skill(**row.to_dict())
-                except ValidationError as e:
-                    errors.setdefault("skills.csv", []).append(f"Row {idx}: {e}")
+            row_errors = _validate_rows(_SKILLS_ADAPTER, self.load_skills())
+            if row_errors:
+                errors["skills.csv"] = row_errors
         except FileNotFoundError as e:
             errors["skills.csv"] = [str(e)]
 
@@ -131,23 +355,17 @@ class CVDataLoader:
 
         # Validate patents
         try:
-            df = self.load_patents()
-            for idx, row in df.iterrows():
-                try:
-                    Patent(**row.to_dict())
-                except ValidationError as e:
-                    errors.setdefault("patents.csv", []).append(f"Row {idx}: {e}")
+            row_errors = _validate_rows(_PATENTS_ADAPTER, self.load_patents())
+            if row_errors:
+                errors["patents.csv"] = row_errors
         except FileNotFoundError as e:
             errors["patents.csv"] = [str(e)]
 
         # Validate publications
         try:
-            df = self.load_publications()
-            for idx, row in df.iterrows():
-                try:
-                    Publication(**row.to_dict())
-                except ValidationError as e:
-                    errors.setdefault("publications.csv", []).append(f"Row {idx}: {e}")
+            row_errors = _validate_rows(_PUBLICATIONS_ADAPTER, self.load_publications())
+            if row_errors:
+                errors["publications.csv"] = row_errors
         except FileNotFoundError as e:
             errors["publications.csv"] = [str(e)]
 
@@ -1,6 +1,6 @@
 """Utility functions for resume builder."""
 
-import re
+import functools
 
 # LaTeX special characters that need escaping
 LATEX_SPECIAL_CHARS = {
@@ -15,8 +15,9 @@ LATEX_SPECIAL_CHARS = {
     "^": r"\textasciicircum{}",
 }
 
-# Pre-compiled regex pattern for efficiency
-_LATEX_ESCAPE_PATTERN = re.compile("|".join(re.escape(k) for k in LATEX_SPECIAL_CHARS))
+# Translation table for a single C-level pass (no regex, no per-match callback)
+_LATEX_TRANSLATE = str.maketrans(LATEX_SPECIAL_CHARS)
+_LATEX_SPECIALS = "".join(LATEX_SPECIAL_CHARS)
 
 
 def escape_latex(text: str) -> str:
@@ -34,11 +35,19 @@ def escape_latex(text: str) -> str:
     """
     if not isinstance(text, str):
         return str(text) if text is not None else ""
+    return _escape_latex_cached(text)
 
-    return _LATEX_ESCAPE_PATTERN.sub(lambda m: LATEX_SPECIAL_CHARS[m.group()], text)
 
+@functools.lru_cache(maxsize=8192)
+def _escape_latex_cached(text: str) -> str:
+    """Escape ``text`` once per distinct string (company names, periods, venues recur)."""
+    # Most CV text has no specials: return it as-is without building a new string
+    if not any(char in text for char in _LATEX_SPECIALS):
+        return text
+    return text.translate(_LATEX_TRANSLATE)
 
-def parse_tags(tags_str: str) -> set[str]:
+
+def parse_tags(tags_str: str) -> frozenset[str]:
     """
     Parse pipe-separated tags string into a set.
 
@@ -46,11 +55,17 @@ def parse_tags(tags_str: str) -> set[str]:
         tags_str: Pipe-separated tags like "ai|ml|python"
 
     Returns:
-        Set of lowercase tag strings
+        Frozen set of lowercase tag strings
     """
     if not tags_str or not isinstance(tags_str, str):
-        return set()
-    return {tag.strip().lower() for tag in tags_str.split("|") if tag.strip()}
+        return frozenset()
+    return _parse_tags_cached(tags_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_tags_cached(tags_str: str) -> frozenset[str]:
+    # Tag strings repeat across rows, so each distinct one is split only once
+    return frozenset(tag.strip().lower() for tag in tags_str.split("|") if tag.strip())
 
 
 def format_period_latex(period: str) -> str:
@@ -0,0 +1,82 @@
+"""Grouping helpers must work on Arrow-backed frames (the loader's dtypes with pyarrow)."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from resume_builder.generators.base import group_experiences, group_skills
+from resume_builder.generators.website import WebsiteGenerator
+from resume_builder.loader import CVDataLoader
+
+pa = pytest.importorskip("pyarrow")
+
+DATA_DIR = Path(__file__).parent.parent / "cv_data"
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def _arrow_strings(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    return df.astype({column: ARROW_STRING for column in columns})
+
+
+def test_group_experiences_on_arrow_strings():
+    df = _arrow_strings(
+        pd.DataFrame(
+            {
+                "company": ["Acme", "Acme", "Acme", "Initech"],
+                "location": ["Paris", "Paris", "Paris", "Austin"],
+                "position": ["Engineer", "Engineer", "Lead", "Dev"],
+                "period": ["2020", "2020", "2021", "2019"],
+                "achievement_group": ["Chips", "", "", ""],
+                "achievement_text": ["low", "high", "led", "coded"],
+                "weight": [1, 5, 0, 0],
+            }
+        ),
+        ["company", "location", "position", "period", "achievement_group", "achievement_text"],
+    )
+
+    grouped = group_experiences(df)
+
+    assert [(job.company, job.position) for job in grouped] == [
+        ("Acme", "Engineer"),
+        ("Acme", "Lead"),
+        ("Initech", "Dev"),
+    ]
+    assert grouped[0].achievements == ["high", "low"]
+    assert grouped[0].achievement_groups == {"Chips": ["low"]}
+    assert all(type(text) is str for job in grouped for text in job.achievements)
+
+
+def test_group_skills_on_arrow_strings():
+    df = _arrow_strings(
+        pd.DataFrame(
+            {
+                "category": ["Languages", "Languages", "Tools"],
+                "skill": ["C", "Python", "Git"],
+                "icon": ["Code", "Code", "Wrench"],
+                "weight": [1, 9, 0],
+            }
+        ),
+        ["category", "skill", "icon"],
+    )
+
+    grouped = group_skills(df)
+
+    assert [(s.category, s.icon, s.skills) for s in grouped] == [
+        ("Languages", "Code", ["Python", "C"]),
+        ("Tools", "Wrench", ["Git"]),
+    ]
+
+
+def test_loader_frames_group_like_object_frames(tmp_path):
+    loader = CVDataLoader(DATA_DIR)
+    experiences = loader.load_experiences()
+    skills = loader.load_skills()
+
+    assert group_experiences(experiences) == group_experiences(experiences.astype(object))
+    assert group_skills(skills) == group_skills(skills.astype(object))
+
+    payload = WebsiteGenerator(DATA_DIR, tmp_path, loader=loader)._build_experiences_payload(
+        None, None
+    )
+    assert payload and all(isinstance(record["company"], str) for record in payload)
@@ -0,0 +1,92 @@
+"""CVDataLoader memoization: mtime-based invalidation and isolation of cached values."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from resume_builder.loader import CVDataLoader
+
+DATA_DIR = Path(__file__).parent.parent / "cv_data"
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    target = tmp_path / "cv_data"
+    shutil.copytree(DATA_DIR, target, ignore=shutil.ignore_patterns("*.parquet"))
+    return target
+
+
+@pytest.fixture
+def read_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the table names actually read from disk."""
+    calls: list[str] = []
+    read_table = CVDataLoader._read_table
+
+    def counting_read_table(self, name, columns=None):
+        calls.append(name)
+        return read_table(self, name, columns)
+
+    monkeypatch.setattr(CVDataLoader, "_read_table", counting_read_table)
+    return calls
+
+
+def _touch_later(path: Path) -> None:
+    """Bump the file's mtime so the change is visible even on coarse clocks."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_repeated_loads_hit_the_cache(data_dir, read_calls):
+    loader = CVDataLoader(data_dir)
+    loader.load_publications()
+    loader.load_publications()
+    loader.load_summary("default")
+    loader.load_summary("default")
+
+    assert read_calls == ["publications", "summary"]
+
+
+def test_cache_is_invalidated_when_the_csv_changes(data_dir, read_calls):
+    loader = CVDataLoader(data_dir)
+    before = loader.load_publications()
+
+    csv_path = data_dir / "publications.csv"
+    lines = csv_path.read_text(encoding="utf-8").splitlines()
+    csv_path.write_text("\n".join(lines[:-1]) + "\n", encoding="utf-8")
+    _touch_later(csv_path)
+
+    after = loader.load_publications()
+    assert len(after) == len(before) - 1
+    assert read_calls == ["publications", "publications"]
+
+
+def test_invalidate_forces_a_reload(data_dir, read_calls):
+    loader = CVDataLoader(data_dir)
+    loader.load_skills()
+    loader.invalidate()
+    loader.load_skills()
+
+    assert read_calls == ["skills", "skills"]
+
+
+def test_in_place_changes_do_not_leak_into_the_cache(data_dir):
+    loader = CVDataLoader(data_dir)
+
+    df = loader.load_experiences()
+    df.loc[df.index[0], "weight"] = -1
+    df.drop(index=df.index[-1], inplace=True)
+
+    # Compare with a fresh loader: a frame from the same loader could share buffers
+    assert loader.load_experiences().equals(CVDataLoader(data_dir).load_experiences())
+
+
+def test_contact_model_is_not_shared(data_dir):
+    loader = CVDataLoader(data_dir)
+    name = loader.load_contact().name
+
+    contact = loader.load_contact()
+    contact.name = "Someone Else"
+
+    assert loader.load_contact().name == name